@@ -1,9 +1,93 @@
+import io
+import math
 import os
 import boto3
+from boto3.s3.transfer import TransferConfig
+import numpy as np
 import pandas as pd
-import re
 import arcpy
 import zipfile
+import time
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# catalog attributes read by the Features and Metadata tables
+CATALOG_ATTRIBUTES = [
+    'feature-name',
+    's3-versionID',
+    'feature-type',
+    's3-file-gdb-zip-location',
+    'fields'
+]
+
+# region of the dynamodb catalog tables
+DYNAMODB_REGION = "us-east-1"
+
+# catalog tables are scanned with one segment per SCAN_SEGMENT_BYTES
+# of table size, up to MAX_SCAN_SEGMENTS parallel segments
+SCAN_SEGMENT_BYTES = 16 * 1024 * 1024
+MAX_SCAN_SEGMENTS = 8
+
+# seconds a cached catalog dump is considered fresh
+DUMP_TTL = 3600
+
+# multipart, multi-threaded download of the gdb zip files
+MB = 1024 * 1024
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MB,
+    multipart_chunksize=16 * MB,
+    max_concurrency=16,
+    use_threads=True
+)
+
+# rasters larger than this (rows or columns) are read tile by tile
+RASTER_TILE = 2048
+
+# float rasters are stored as int16 at the largest of these scales
+# their range fits, if rounding moves no cell by more than
+# QUANTIZE_TOLERANCE of a step, nor by more than QUANTIZE_TOLERANCE
+# of its own value for cells smaller than a step; otherwise as float16
+# if no cell moves by more than float16 rounding (FLOAT16_TOLERANCE of
+# its value). Cells are checked QUANTIZE_CHUNK at a time
+QUANTIZE_SCALES = (1000.0, 100.0, 10.0, 1.0)
+QUANTIZE_TOLERANCE = 1e-3
+FLOAT16_TOLERANCE = float(np.finfo(np.float16).eps) / 2
+QUANTIZE_CHUNK = 1024 * 1024
+
+# boto3 clients are thread-safe and shared across threads and instances,
+# resources are not, so every thread builds its own from its own session
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+_THREAD_LOCAL = threading.local()
+
+
+def _getClient(service, **kwargs):
+    """
+    Return the shared boto3 client for a service,
+    creating it the first time it is requested
+    """
+    # clients built with different settings are cached separately
+    key = (service, tuple(sorted(kwargs.items())))
+    with _CLIENTS_LOCK:
+        if key not in _CLIENTS:
+            _CLIENTS[key] = boto3.client(service, **kwargs)
+        return _CLIENTS[key]
+
+
+def _getResource(service, **kwargs):
+    """
+    Return the boto3 resource for a service owned by the
+    calling thread, creating it the first time it is requested
+    """
+    resources = getattr(_THREAD_LOCAL, 'resources', None)
+    if resources is None:
+        resources = _THREAD_LOCAL.resources = {}
+    key = (service, tuple(sorted(kwargs.items())))
+    if key not in resources:
+        resources[key] = boto3.session.Session().resource(service, **kwargs)
+    return resources[key]
 
 
 class jge_Catalog:
@@ -11,14 +95,29 @@ class jge_Catalog:
     class for the jge catalog data management
     """
 
-    def __init__(self, table="jge-catalog-test-03"):
+    def __init__(self, table="jge-catalog-test-03", segments=None):
         self.__table = table  # dynamodb table holding the jge catalog
-        self.__ds = self.__queryCatalog__()  # returns a list of dicts.
-        # read catalog features
-        self.__Features = self.__getCatalogFeatures__(self.__ds)
-        # read catalog metadata
-        self.__Metadata = self.__getCatalogMetadata__(self.__ds)
+        # num. of parallel scan segments, None to size it from the table
+        self.__segments = segments
+        # returns a list of dicts projected to the catalog attributes
+        self.__ds = self.__queryCatalog__(CATALOG_ATTRIBUTES)
+        # read catalog features and metadata in a single pass
+        self.__Features, self.__Metadata = self.__buildTables__(self.__ds)
         self.FeaturesCount = self.__Features.shape[0]  # num. of features
+        # lookup tables built once as the catalog is not modified
+        self.__byVersion = self.__buildIndex__(
+            self.__Features, 's3-versionID',
+            ['feature-name', 'feature-type', 's3-file-gdb-zip-location'])
+        self.__byFeatureType = self.__buildIndex__(
+            self.__Features, 'feature-type',
+            ['feature-name', 's3-versionID', 's3-file-gdb-zip-location'])
+        meta = self.__Metadata
+        self.__metaByKey = {}
+        for key, fields in zip(zip(meta['feature-name'], meta['s3-versionID']),
+                               meta['fields']):
+            self.__metaByKey.setdefault(key, fields)  # first entry wins
+        self.__dump = None  # cached full catalog scan used by dumps()
+        self.__dumpTime = 0.0  # monotonic time of the cached scan
         return
 
     def getCatalogName(self):
@@ -27,60 +126,117 @@ class jge_Catalog:
         """
         return self.__table
 
-    def __queryCatalog__(self):
+    def __queryCatalog__(self, attributes=None):
         """
-        Query the Catalog and return an iterable dataset
+        Query the Catalog and return an iterable dataset.
+        Large tables are read as a parallel scan, one segment per worker.
+        If attributes is given only those attributes are returned.
         """
-        # Creating the DynamoDB Table Resource
-        dynamodb = boto3.resource('dynamodb', region_name="us-east-1")
+        total_segments = self.__scanSegments__()
+        if total_segments == 1:
+            return self.__scanSegment__(0, 1, attributes)
+
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            futures = [
+                executor.submit(self.__scanSegment__, segment,
+                                total_segments, attributes)
+                for segment in range(total_segments)
+            ]
+            list_dict = []
+            for future in futures:
+                list_dict.extend(future.result())
+
+        return list_dict
+
+    def __scanSegments__(self):
+        """
+        Return the number of segments to scan the catalog with,
+        sized from the table size unless given to the constructor
+        """
+        if self.__segments is not None:
+            return max(1, self.__segments)
+        dynamodb = _getClient('dynamodb', region_name=DYNAMODB_REGION)
+        size = dynamodb.describe_table(
+            TableName=self.__table)['Table']['TableSizeBytes']
+        segments = math.ceil(size / SCAN_SEGMENT_BYTES)
+        return min(max(1, segments), MAX_SCAN_SEGMENTS)
+
+    def __scanSegment__(self, segment, total_segments, attributes=None):
+        """
+        Scan a single segment of the catalog table, following
+        the pagination until the segment is exhausted
+        """
+        # Creating the DynamoDB Table Resource owned by this thread
+        dynamodb = _getResource('dynamodb', region_name=DYNAMODB_REGION)
         table = dynamodb.Table(self.__table)
 
-        response = table.scan()
-        list_dict = response['Items']
+        scan_kwargs = {'Segment': segment, 'TotalSegments': total_segments}
+        if attributes:
+            # attribute names are hyphenated so they go through placeholders
+            names = {f'#a{i}': attr for i, attr in enumerate(attributes)}
+            scan_kwargs['ProjectionExpression'] = ', '.join(names)
+            scan_kwargs['ExpressionAttributeNames'] = names
+        response = table.scan(**scan_kwargs)
+        items = response['Items']
 
         while 'LastEvaluatedKey' in response:
             response = table.scan(
-                ExclusiveStartKey=response['LastEvaluatedKey']
+                ExclusiveStartKey=response['LastEvaluatedKey'],
+                **scan_kwargs
             )
-            list_dict.extend(response['Items'])
+            items.extend(response['Items'])
 
-        return list_dict
+        return items
 
-    def __getCatalogMetadata__(self, dataset):
+    def __buildTables__(self, dataset):
         """
-        return a dataframe with the following columns:
+        Walk the catalog dataset once and return two dataframes:
+        Features with the following columns:
+         (1) feature-name
+         (2) s3-versionID
+         (3) feature-type
+         (4) s3-file-gdb-zip-location
+        Metadata with the following columns:
          (1) feature-name
          (2) s3-versionID
          (3) fields (metadata)
         """
-        df = pd.DataFrame(columns=['feature-name', 's3-versionID', 'fields'])
-        for ds in dataset:
-            row_data = {
-                'feature-name': ds['feature-name'],
-                's3-versionID': ds['s3-versionID'],
-                'fields': ds['fields'][0]
-            }
-            df = df.append(row_data, ignore_index=True)
-        return df
+        names, versions, types, locations, fields = [], [], [], [], []
+        for entry in dataset:
+            names.append(entry['feature-name'])
+            versions.append(entry['s3-versionID'])
+            types.append(entry['feature-type'])
+            locations.append(entry['s3-file-gdb-zip-location'])
+            fields.append(entry['fields'][0])
 
-    def __getCatalogFeatures__(self, list_dict):
+        features = pd.DataFrame({
+            'feature-name': names,
+            's3-versionID': versions,
+            'feature-type': types,
+            's3-file-gdb-zip-location': locations
+        })
+
+        metadata = pd.DataFrame({
+            'feature-name': names,
+            's3-versionID': versions,
+            'fields': fields
+        })
+        return features, metadata
+
+    def __buildIndex__(self, df, key, columns):
         """
-        Return a dataframe with the following columns:
-         (1) feature-name
-         (2) s3-versionID
-         (3) feature-type
-         (4) s3-file-gdb-zip-location
+        Return a dictionary mapping every value of the key column
+        to the list of rows (selected columns) sharing that value.
+        Rows are read-only as they are handed out to every caller.
         """
-        df = pd.DataFrame(columns=['feature-name', 's3-versionID', 'feature-type', 's3-file-gdb-zip-location'])
-        for dict_entry in list_dict:
-            row_data = {
-                'feature-name': dict_entry['feature-name'],
-                's3-versionID': dict_entry['s3-versionID'],
-                'feature-type': dict_entry['feature-type'],
-                's3-file-gdb-zip-location': dict_entry['s3-file-gdb-zip-location']
-            }
-            df = df.append(row_data, ignore_index=True)
-        return df
+        # extract the columns once, then slice the rows of every group
+        values = df[columns].to_numpy()
+        index = {}
+        for value, rows in df.groupby(key, sort=False).indices.items():
+            group = values[rows]
+            group.flags.writeable = False  # rows are views of the group
+            index[value] = list(group)
+        return index
 
     def getFeatures(self):
         '''
@@ -90,72 +246,38 @@ class jge_Catalog:
 
     def getMetaData(self, featureName, versionID):
         '''
-        Return metadata of a featureName and versionID
+        Return metadata of a featureName and versionID,
+        None if the pair is not in the catalog
         '''
-        df = self.__Metadata
-        cond1 = (df['feature-name'] == featureName)
-        cond2 = (df['s3-versionID'] == versionID)
-        result = []
-        try:
-            result = df.loc[cond1 & cond2, 'fields'].reset_index(drop=True)
-            result = result.values
-        except IndexError as ie:
-            print(f'Non existent Index: {versionID} -- {ie}')
-        except KeyError as ke:
-            print(f'Non existent Key: {versionID} -- {ke}')
-        return result
+        return self.__metaByKey.get((featureName, versionID))
 
     def getObjectsByVersionID(self, versionID):
         """
         By using versionID which is unique, returns a dictionary
-        with Feature Name and Feature Type members
+        with Feature Name and Feature Type members (read-only rows)
         """
-        df = self.__Features
         db = {}
-        res = df.loc[df['s3-versionID'] == versionID,
-                     ['feature-name',
-                      'feature-type',
-                      's3-file-gdb-zip-location']]
-        if len(res) == 0:
-            res = db
-        else:
-            for i in list(res.index):
-                # check if the key (versionID) in db. if it's in, append
-                if (versionID) in db:
-                    db[versionID].append(res.loc[i].values)
-                # else new a key
-                else:
-                    db[versionID] = [res.loc[i].values]
+        if versionID in self.__byVersion:
+            db[versionID] = list(self.__byVersion[versionID])
         return db
 
     def getObjectsByFeatureType(self, featureType):
         """
         By using featureType, returns a dictionary
-        with Feature Name and s3 versionID members
+        with Feature Name and s3 versionID members (read-only rows)
         """
-        df = self.__Features
         db = {}
-        res = df.loc[df['feature-type'] == featureType,
-                     ['feature-name',
-                      's3-versionID',
-                      's3-file-gdb-zip-location']]
-        if len(res) == 0:
-            res = db
-        else:
-            for i in list(res.index):
-                # check if the key (featureType) in db. if it's in, append
-                if (featureType) in db:
-                    db[featureType].append(res.loc[i].values)
-                # else new a key
-                else:
-                    db[featureType] = [res.loc[i].values]
+        if featureType in self.__byFeatureType:
+            db[featureType] = list(self.__byFeatureType[featureType])
         return db
 
     def __extractBucketAndKey__(self, s3_location):
-        pattern = r's3:\/\/(.*?)\/(.*)'
-        bucket_and_key = re.compile(pattern)
-        m = bucket_and_key.match(s3_location)
-        bucket, key = m[1], m[2]
+        """
+        Split an s3://bucket/key location into bucket and key
+        """
+        if not s3_location.startswith('s3://'):
+            raise ValueError(f'Not an s3 location: {s3_location}')
+        bucket, _, key = s3_location[len('s3://'):].partition('/')
         return bucket, key
 
     def __download_s3_zip__(self, versionID):
@@ -164,78 +286,198 @@ class jge_Catalog:
         referred in the catalog and unzip the .zip into a
         temp folder for further processing/data extraction
         """
-        # step 1: search for the zip in dynamodb using versionID
-        df = self.getFeatures()
-        c1 = (df['s3-versionID'] == versionID)
-        s3_key = df.loc[c1, ['s3-file-gdb-zip-location']].head(1).values
-        bucket, key = self.__extractBucketAndKey__(s3_key[0][0])
+        # step 1: search for the zip in the catalog using versionID
+        s3_location = self.__byVersion[versionID][0][2]
+        bucket, key = self.__extractBucketAndKey__(s3_location)
         # step 2: extract the zip into a temp folder
-        if not (os.path.exists('temp') and os.path.isdir('temp')):
-            try:
-                os.mkdir('temp')
-            except OSError as e:
-                print(f'*** error *** {e}')
-        s3 = boto3.resource('s3')
-        temp_folder = 'temp/'
+        temp_folder = os.path.abspath('temp')
+        try:
+            # exist_ok so concurrent downloads don't race on creating it
+            os.makedirs(temp_folder, exist_ok=True)
+        except OSError as e:
+            print(f'*** error *** {e}')
+        s3_client = _getClient('s3')
         temp_file = os.path.split(key)[1]
-        file2download = temp_folder+temp_file
-        s3.meta.client.download_file(bucket, key, file2download)
-        cur_dir = os.getcwd()
-        os.chdir(temp_folder)
-        file_name = os.path.abspath(temp_file)
-        zip_ref = zipfile.ZipFile(file_name)  # create zipfile object
-        zip_ref.extractall('.')  # extract file to dir
-        zip_ref.close()  # close file
-        os.remove(file_name)  # delete zipped file
+        # stream the zip into memory and extract it straight from there
+        buffer = io.BytesIO()
+        s3_client.download_fileobj(bucket, key, buffer,
+                                   Config=S3_TRANSFER_CONFIG)
+        buffer.seek(0)
+        with zipfile.ZipFile(buffer) as zip_ref:
+            zip_ref.extractall(temp_folder)  # extract file to dir
         # step 3: return temp folder and gdb filename
-        file_dir, file_zip = os.path.split(file_name)
-        file_gdb = os.path.join(file_dir, os.path.splitext(file_zip)[0])
-        os.chdir(cur_dir)
+        file_gdb = os.path.join(temp_folder, os.path.splitext(temp_file)[0])
         return file_gdb
 
-    def __compileDataset__(self, abs_path_file_gdb, versionID):
+    def __readRaster__(self, raster_path, nan_nodata=False):
+        """
+        Read a raster into a numpy array. Large rasters are read in
+        RASTER_TILE x RASTER_TILE blocks into a preallocated array
+        instead of a single full-size read. With nan_nodata the
+        nodata cells of float rasters are read as nan.
+        """
+        raster = arcpy.Raster(raster_path)
+        kwargs = {}
+        if nan_nodata and raster.pixelType in ('F32', 'F64'):
+            kwargs['nodata_to_value'] = np.nan
+        nrows, ncols = raster.height, raster.width
+        if nrows <= RASTER_TILE and ncols <= RASTER_TILE:
+            return arcpy.RasterToNumPyArray(raster, **kwargs)
+
+        extent = raster.extent
+        cell_w, cell_h = raster.meanCellWidth, raster.meanCellHeight
+        arr = None
+        for row in range(0, nrows, RASTER_TILE):
+            tile_rows = min(RASTER_TILE, nrows - row)
+            for col in range(0, ncols, RASTER_TILE):
+                tile_cols = min(RASTER_TILE, ncols - col)
+                # arrays are indexed from the top, arcpy tiles from the bottom
+                lower_left = arcpy.Point(extent.XMin + col * cell_w,
+                                         extent.YMax - (row + tile_rows) * cell_h)
+                tile = arcpy.RasterToNumPyArray(raster, lower_left,
+                                                tile_cols, tile_rows,
+                                                **kwargs)
+                if arr is None:
+                    # multiband tiles carry a leading band dimension
+                    arr = np.empty(tile.shape[:-2] + (nrows, ncols),
+                                   dtype=tile.dtype)
+                arr[..., row:row + tile_rows, col:col + tile_cols] = tile
+        return arr
+
+    def __quantizeRaster__(self, arr):
+        """
+        Return a narrower copy of a float raster and its scale
+        (original = quantized / scale), None if it can't be narrowed.
+        Rasters without nan (nodata) cells whose values fit int16 at
+        one of QUANTIZE_SCALES without losing precision become int16,
+        others are cast to float16 when every cell keeps float16
+        precision (no overflow, no underflow to subnormals or zero).
+        """
+        if arr.dtype.kind != 'f' or arr.dtype.itemsize <= 2 or arr.size == 0:
+            return None
+        with warnings.catch_warnings():
+            # all-nan rasters are rejected just below
+            warnings.simplefilter('ignore', RuntimeWarning)
+            low, high = float(np.nanmin(arr)), float(np.nanmax(arr))
+        if not (np.isfinite(low) and np.isfinite(high)):
+            return None
+        max_abs = max(abs(low), abs(high))
+        flat = arr.reshape(-1)
+        # the range is finite, so the sum is nan only if a cell is nan
+        has_nan = np.isnan(flat.sum(dtype=np.float64))
+
+        scales = [s for s in QUANTIZE_SCALES if max_abs * s <= 32767]
+        if scales and not has_nan:
+            scale = scales[0]
+            arr_q = np.empty(arr.shape, dtype=np.int16)
+            flat_q = arr_q.reshape(-1)
+            for start in range(0, flat.size, QUANTIZE_CHUNK):
+                scaled = flat[start:start + QUANTIZE_CHUNK] * scale
+                rounded = np.rint(scaled)
+                flat_q[start:start + QUANTIZE_CHUNK] = rounded
+                np.subtract(rounded, scaled, out=rounded)
+                np.abs(rounded, out=rounded)
+                # cells smaller than a step are held to a relative bound
+                np.abs(scaled, out=scaled)
+                np.minimum(scaled, 1.0, out=scaled)
+                if (rounded > QUANTIZE_TOLERANCE * scaled).any():
+                    break
+            else:
+                return arr_q, scale
+            del arr_q, flat_q
+
+        if max_abs > float(np.finfo(np.float16).max):
+            return None
+        arr_h = arr.astype(np.float16)
+        flat_h = arr_h.reshape(-1)
+        for start in range(0, flat.size, QUANTIZE_CHUNK):
+            chunk = flat[start:start + QUANTIZE_CHUNK]
+            error = flat_h[start:start + QUANTIZE_CHUNK].astype(chunk.dtype)
+            np.subtract(error, chunk, out=error)
+            np.abs(error, out=error)
+            # nan cells compare False, so nodata never rejects the raster
+            if (error > FLOAT16_TOLERANCE * np.abs(chunk)).any():
+                return None
+        return arr_h, 1.0
+
+    def __compileRaster__(self, abs_path_file_gdb, in_raster, versionID,
+                          quantize=False):
+        """
+        Read a Raster Dataset of the gdb into a dataset entry,
+        None if the raster couldn't be read
+        """
+        try:
+            in_raster_arr = self.__readRaster__(
+                os.path.join(abs_path_file_gdb, in_raster),
+                nan_nodata=quantize)
+        except arcpy.ExecuteError:
+            print(f"File {in_raster} couldn't be read")
+            return None
+        entry = {
+            's3-versionID': versionID,
+            'feature-type': 'Raster Dataset',
+            'shape': in_raster_arr.shape,
+            'columns': [],
+            'data': [in_raster_arr]
+        }
+        quantized = self.__quantizeRaster__(in_raster_arr) if quantize else None
+        if quantized is not None:
+            entry['data'] = [quantized[0]]
+            entry['scale'] = quantized[1]
+            entry['orig_dtype'] = str(in_raster_arr.dtype)
+        return entry
+
+    def __compileVector__(self, abs_path_file_gdb, in_vector, versionID):
+        """
+        Read a Feature Class of the gdb into a dataset entry,
+        None if the feature class couldn't be read
+        """
+        in_vector_path = os.path.join(abs_path_file_gdb, in_vector)
+        try:
+            # to get a handle of the columns
+            desc = arcpy.Describe(in_vector_path)
+            fields = [field.name for field in desc.fields]
+            in_vector_arr = arcpy.da.TableToNumPyArray(
+                in_vector_path, fields, null_value='-', skip_nulls=True)
+        except arcpy.ExecuteError:
+            print(f"File {in_vector} couldn't be read")
+            return None
+        return {
+            's3-versionID': versionID,
+            'feature-type': 'Feature Class',
+            'shape': in_vector_arr.shape,
+            'columns': fields,
+            'data': [in_vector_arr]
+        }
+
+    def __compileDataset__(self, abs_path_file_gdb, versionID, quantize=False):
         dataset = [{}]
+        # the workspace is global to arcpy, so it is only set here to list
+        # the gdb content; workers read their item by absolute path
         arcpy.env.workspace = abs_path_file_gdb
-
-        # compile all Raster Datasets stored in the gdb
-        rasters = arcpy.ListRasters("*", "ALL")
-        for i, in_raster in enumerate(rasters):
-            try:
-                in_raster_arr = arcpy.RasterToNumPyArray(in_raster)
-                if in_raster not in dataset[0]:
-                    dataset[0][in_raster] = {
-                        's3-versionID': versionID,
-                        'feature-type': 'Raster Dataset',
-                        'shape': in_raster_arr.shape,
-                        'columns': [],
-                        'data': [in_raster_arr]
-                    }
-            except arcpy.ExecuteError:
-                print(f"File {in_raster} couldn't be read")
-
-        # compile all Feature Classes stored in the gdb
-        vectors = arcpy.ListFeatureClasses('*', 'All')
-        for i, in_vector in enumerate(vectors):
-            try:
-                # to get a handle of the columns
-                desc = arcpy.Describe(in_vector)
-                fields = [field.name for field in desc.fields]
-                in_vector_arr = arcpy.da.TableToNumPyArray(
-                    in_vector, fields, null_value='-', skip_nulls=True)
-                if in_vector not in dataset[0]:
-                    dataset[0][in_vector] = {
-                        's3-versionID': versionID,
-                        'feature-type': 'Feature Class',
-                        'shape': in_vector_arr.shape,
-                        'columns': fields,
-                        'data': [in_vector_arr]
-                    }
-            except arcpy.ExecuteError:
-                print(f"File {in_vector} couldn't be read")
+        # compile all Raster Datasets and Feature Classes stored in the gdb
+        compile_raster = partial(self.__compileRaster__, quantize=quantize)
+        items = [(compile_raster, in_raster)
+                 for in_raster in arcpy.ListRasters("*", "ALL")]
+        items += [(self.__compileVector__, in_vector)
+                  for in_vector in arcpy.ListFeatureClasses('*', 'All')]
         arcpy.env.workspace = None
+        if not items:
+            return dataset
+
+        with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+            futures = [
+                (name, executor.submit(compile_item, abs_path_file_gdb,
+                                       name, versionID))
+                for compile_item, name in items
+            ]
+            for name, future in futures:
+                entry = future.result()
+                if entry is not None:
+                    dataset[0][name] = entry
         return dataset
 
-    def retrieveDataset(self, versionID):
+    def retrieveDataset(self, versionID, quantize=False):
         """
         Extract all Datasets (Raster and Vector) from a
         particular versionID. It returns a dictionary:
@@ -260,23 +502,35 @@ class jge_Catalog:
         This is implemented for convenience as every
         geoDatabase may contain several raster and vector
         files. It uses the arcPy library.
+        With quantize=True float rasters are read with nan
+        nodata cells and stored narrowed when possible: int16
+        if no precision is lost, otherwise float16 (lossy, about
+        3 significant digits). Their entry gets two more keys:
+        'scale' (original = data / scale) and 'orig_dtype'.
         """
         # file_gdb is the absolute path of the gdb
         file_gdb = self.__download_s3_zip__(versionID)
 
         # compile all objects from the file_gdb
-        dataset = self.__compileDataset__(file_gdb, versionID)
+        dataset = self.__compileDataset__(file_gdb, versionID, quantize)
         arcpy.management.Delete(file_gdb)
 
         return dataset
 
-    def dumps(self):
+    def dumps(self, refresh=False):
         """
-        Dump the entire catalog as a JSON structure
+        Dump the entire catalog as a JSON structure.
+        The scan is cached for DUMP_TTL seconds, use
+        refresh=True to force a new scan of the catalog.
+        A new list is returned on every call; the items in
+        it are shared with the cache and must not be modified.
         """
-        # call the query catalog
-        ds = self.__queryCatalog__()
-        return ds
+        expired = time.monotonic() - self.__dumpTime > DUMP_TTL
+        if refresh or self.__dump is None or expired:
+            # call the query catalog
+            self.__dump = self.__queryCatalog__()
+            self.__dumpTime = time.monotonic()
+        return list(self.__dump)
 
 # class ds_Catalog:
 #     'class for the ds models catalog management'
@@ -0,0 +1,46 @@
+import sys
+import types
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('pandas')
+pytest.importorskip('boto3')
+
+# arcpy only ships with ArcGIS, the raster helpers tested here don't use it
+sys.modules.setdefault('arcpy', types.ModuleType('arcpy'))
+
+import catalogs  # noqa: E402
+
+
+def quantize(arr):
+    catalog = object.__new__(catalogs.jge_Catalog)
+    return catalog.__quantizeRaster__(arr)
+
+
+def test_quantize_decimals_to_int16():
+    arr = np.array([[12.34, -0.5], [0.0, 250.01]], dtype=np.float32)
+    arr_q, scale = quantize(arr)
+    assert arr_q.dtype == np.int16
+    assert scale == 100.0
+    np.testing.assert_allclose(arr_q / scale, arr, rtol=1e-6)
+
+
+def test_quantize_small_values_not_zeroed():
+    arr = np.array([[1e-7, 1e-6]], dtype=np.float32)
+    assert quantize(arr) is None
+
+
+def test_quantize_nan_nodata_to_float16():
+    arr = np.array([[np.nan, 1.5], [2.25, -3.0]], dtype=np.float32)
+    arr_q, scale = quantize(arr)
+    assert arr_q.dtype == np.float16
+    assert scale == 1.0
+    assert np.isnan(arr_q[0, 0])
+    np.testing.assert_array_equal(arr_q[~np.isnan(arr)], arr[~np.isnan(arr)])
+
+
+def test_quantize_skips_out_of_range_and_integer_rasters():
+    assert quantize(np.array([[1.0, -3.4e38]], dtype=np.float32)) is None
+    assert quantize(np.full((2, 2), np.nan, dtype=np.float32)) is None
+    assert quantize(np.ones((2, 2), dtype=np.uint8)) is None